@@ -21,5 +21,7 @@ class AsyncBool(AsyncValue):
     same as AsyncValue.
     """
 
+    __slots__ = ()
+
     def __init__(self, value=False):
         super().__init__(value)
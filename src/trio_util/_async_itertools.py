@@ -1,24 +1,43 @@
 import trio
 
 
-async def _azip(*aiterables, fillvalue, stop_any):
-    iters = [item.__aiter__() for item in aiterables]
-    while True:
-        stop_count = 0
-        items = [fillvalue] * len(iters)
+async def _collect(i, anext_fn, items, stop_count, fillvalue):
+    try:
+        items[i] = await anext_fn()
+    except StopAsyncIteration:
+        # keep exhausted slots at fillvalue so that the items list can be
+        # reused across rounds
+        items[i] = fillvalue
+        stop_count[0] += 1
+
 
-        async def collect(i, iterator):
+async def _azip(*aiterables, fillvalue, stop_any):
+    # bound __anext__ methods are cached to avoid an attribute lookup
+    # per item per round
+    nexts = [item.__aiter__().__anext__ for item in aiterables]
+    if len(nexts) == 1:
+        # no parallelism to manage-- skip the nursery machinery
+        # (stop_any is irrelevant with a single iterable)
+        anext_fn, = nexts
+        while True:
             try:
-                items[i] = await iterator.__anext__()
+                item = await anext_fn()
             except StopAsyncIteration:
-                nonlocal stop_count
-                stop_count += 1
+                return
+            yield (item,)
+    items = [fillvalue] * len(nexts)
+    min_stops = 1 if stop_any else len(nexts)
+    while True:
+        # single-element list rather than a closure cell, so that the
+        # collector can live at module level instead of being rebuilt
+        # every round
+        stop_count = [0]
 
         async with trio.open_nursery() as nursery:
-            for i, iterator in enumerate(iters):
-                nursery.start_soon(collect, i, iterator)
+            for i, anext_fn in enumerate(nexts):
+                nursery.start_soon(_collect, i, anext_fn, items, stop_count, fillvalue)
 
-        if stop_count >= (1 if stop_any else len(iters)):
+        if stop_count[0] >= min_stops:
             break
         yield tuple(items)
 
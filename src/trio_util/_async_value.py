@@ -1,6 +1,7 @@
 # pylint: disable=line-too-long,multiple-statements
-from contextlib import contextmanager
-from typing import TypeVar, Generic, AsyncIterator, Tuple, Callable, overload
+from contextlib import contextmanager, ExitStack
+from functools import lru_cache, partial
+from typing import TypeVar, Generic, AsyncIterator, Optional, Tuple, Callable, overload
 try:
     from typing import ContextManager
 except ImportError:
@@ -20,27 +21,50 @@ class _WaitQueue:
     """Fast replacement for trio.ParkingLot.
 
     The typical unpark_all() is 2x faster.
+
+    A single waiter (the dominant case for wait_value / wait_transition)
+    is held in a dedicated slot, avoiding hash table operations; further
+    waiters overflow into a list, which is smaller and faster to iterate
+    at the typical size of 1-3 (abort's O(N) remove is fine there too).
     """
 
-    __slots__ = ['tasks']
+    __slots__ = ['task', 'tasks']
 
     def __init__(self):
-        self.tasks = set()
+        self.task = None
+        self.tasks: Optional[list] = None
 
     async def park(self):
         task = lowlevel.current_task()
-        self.tasks.add(task)
+        if self.task is None:
+            self.task = task
+        else:
+            if self.tasks is None:
+                self.tasks = []
+            self.tasks.append(task)
 
         def abort_fn(_):
-            self.tasks.remove(task)
+            if self.task is task:
+                self.task = None
+            else:
+                tasks = self.tasks
+                if tasks is not None:  # always true here (narrows the Optional)
+                    tasks.remove(task)
             return lowlevel.Abort.SUCCEEDED
 
         await lowlevel.wait_task_rescheduled(abort_fn)
 
     def unpark_all(self):
-        for task in self.tasks:
+        task = self.task
+        if task is not None:
+            self.task = None
             lowlevel.reschedule(task)
-        self.tasks.clear()
+        tasks = self.tasks
+        if tasks:
+            reschedule = lowlevel.reschedule
+            for task in tasks:
+                reschedule(task)
+            tasks.clear()
 
 
 def _ANY_TRANSITION(value, old_value):
@@ -58,45 +82,134 @@ P = Callable[[T], bool]
 P2 = Callable[[T, T], bool]
 
 
-class _Result:
-    __slots__ = ['event', 'value']
+class _Result(_WaitQueue):
+    """A wait queue with the value which woke it, saving an allocation
+    and an indirection versus holding a _WaitQueue attribute."""
+
+    __slots__ = ['value']
 
     def __init__(self):
-        self.event = _WaitQueue()
+        super().__init__()
         self.value = None
 
 
 # TODO: hash functools.partial by func + args + keywords when possible
-class _ValueWrapper:
+class _ValueWrapperBase:
     """
-    If value_or_predicate is not callable, wrap it in a suitable callable, and
-    hash by the original value if possible.
+    Wrap a plain value in an equality predicate, hashed by the original
+    value if possible.
 
     This provides a consistent interface for awaitables, and allows listeners
     of the same plain value to share a wait queue.
-    """
 
-    __slots__ = ['value']
+    Subclasses supply __call__ with the exact level or edge predicate
+    arity (rather than a shared *args signature which would pack a
+    throwaway tuple per evaluation).
+    """
 
-    def __new__(cls, value_or_predicate):
-        return value_or_predicate if callable(value_or_predicate) else super().__new__(cls)
+    __slots__ = ['value', '_hash']
 
     def __init__(self, value):
         self.value = value
-
-    def __hash__(self):
         try:
-            return hash(self.value)
+            self._hash = hash(value)
         except TypeError:
-            return super().__hash__()
+            self._hash = object.__hash__(self)
+
+    def __hash__(self):
+        return self._hash
 
     def __eq__(self, other):
-        return self.value.__eq__(other.value)
+        return isinstance(other, _ValueWrapperBase) and self.value == other.value
+
 
-    def __call__(self, x, *args):
+class _ValueWrapper(_ValueWrapperBase):
+    """equality wrapper with the (value,) arity of level predicates"""
+
+    __slots__ = ()
+
+    def __call__(self, x):
         return x == self.value
 
 
+class _EdgeValueWrapper(_ValueWrapperBase):
+    """equality wrapper with the (value, old_value) arity of edge predicates"""
+
+    __slots__ = ()
+
+    def __call__(self, x, old):
+        return x == self.value
+
+
+@lru_cache(maxsize=1024)
+def _cached_wrapper(value):
+    return _ValueWrapper(value)
+
+
+@lru_cache(maxsize=1024)
+def _cached_edge_wrapper(value):
+    return _EdgeValueWrapper(value)
+
+
+def _as_predicate(value_or_predicate):
+    """Pass callables through, wrapping anything else in _ValueWrapper
+
+    Wrappers of hashable values are memoized, since waiting repeatedly on
+    the same literal (enum members, etc.) is the typical pattern.
+    """
+    if callable(value_or_predicate):
+        return value_or_predicate
+    try:
+        return _cached_wrapper(value_or_predicate)
+    except TypeError:  # unhashable value
+        return _ValueWrapper(value_or_predicate)
+
+
+def _as_edge_predicate(value_or_predicate):
+    """As _as_predicate(), wrapping non-callables in _EdgeValueWrapper"""
+    if callable(value_or_predicate):
+        return value_or_predicate
+    try:
+        return _cached_edge_wrapper(value_or_predicate)
+    except TypeError:  # unhashable value
+        return _EdgeValueWrapper(value_or_predicate)
+
+
+class _NotPredicate:
+    """Negation of the given predicate, hashed by the underlying predicate.
+
+    Unlike an ad-hoc lambda, listeners negating the same predicate (or
+    equal _ValueWrapper instances) will share a wait queue.
+    """
+
+    __slots__ = ['predicate']
+
+    def __init__(self, predicate):
+        self.predicate = predicate
+
+    def __hash__(self):
+        return hash((_NotPredicate, self.predicate))
+
+    def __eq__(self, other):
+        return isinstance(other, _NotPredicate) and self.predicate == other.predicate
+
+    def __call__(self, x):
+        return not self.predicate(x)
+
+
+class _NotEqualValue:
+    """Wait state matching any value other than the wrapped (mutable) value.
+
+    Registered in a dedicated map so the setter can compare inline
+    rather than making a Python call per subscriber.
+    """
+
+    __slots__ = ['value']
+
+    def __init__(self, value):
+        self.value = value
+
+
 class AsyncValue(Generic[T]):
     """
     Value wrapper offering the ability to wait for a value or transition.
@@ -151,15 +264,29 @@ class AsyncValue(Generic[T]):
     Performance note:  assignment to the `value` property typically has O(N)
     complexity, where N is the number of actively waiting tasks.  Shared
     predicates are grouped when possible, reducing N to the number of active
-    predicates.
+    predicates.  Waits on a plain hashable value are dispatched by direct
+    lookup rather than a predicate scan.
     """
 
+    __slots__ = ['_value', '_level_results', '_level_eq', '_edge_results',
+                 '_edge_eq', '_not_value_results', '_transforms', '__weakref__']
+
     def __init__(self, value: T):
         self._value = value
+        # Aside from _level_results (which compose_values() reaches into),
+        # the listener maps are created on first use, keeping plain
+        # AsyncValue instances cheap to construct.
         self._level_results = _RefCountedDefaultDict(_Result)
-        self._edge_results = _RefCountedDefaultDict(_Result)
+        # hashable plain values waited on by equality, keyed by the value
+        # itself for O(1) dispatch in the setter
+        self._level_eq: Optional[_RefCountedDefaultDict] = None
+        self._edge_results: Optional[_RefCountedDefaultDict] = None
+        # as _level_eq, but for transitions to a hashable plain value
+        self._edge_eq: Optional[_RefCountedDefaultDict] = None
+        # _NotEqualValue states from eventual_values iterators
+        self._not_value_results: Optional[_RefCountedDefaultDict] = None
         # predicate: AsyncValue
-        self._transforms = _RefCountedDefaultDict(lambda: AsyncValue(_NONE))
+        self._transforms: Optional[_RefCountedDefaultDict] = None
 
     def __repr__(self):
         return f"{self.__class__.__name__}({self.value})"
@@ -171,25 +298,108 @@ class AsyncValue(Generic[T]):
 
     @value.setter
     def value(self, x: T):
-        if self._value != x:
-            old = self._value
+        old = self._value
+        # `is` check short-circuits the (possibly expensive) __eq__ for
+        # no-op writes of the same object
+        if old is not x and old != x:
             new = self._value = x
-            for f, result in self._level_results.items():
-                if f(new):
+            level_results = self._level_results
+            level_eq = self._level_eq
+            edge_results = self._edge_results
+            edge_eq = self._edge_eq
+            not_value_results = self._not_value_results
+            transforms = self._transforms
+            # fast path for the produce-only case: no listeners of any kind
+            if not (level_results or level_eq or edge_results or edge_eq
+                    or not_value_results or transforms):
+                return
+            if level_eq or edge_eq:
+                try:
+                    level_result = level_eq.get(new) if level_eq else None
+                    edge_result = edge_eq.get(new) if edge_eq else None
+                except TypeError:
+                    # unhashable new value-- fall back to an equality scan so
+                    # that waits on an equal hashable value still fire
+                    if level_eq:
+                        for key, result in level_eq.items():
+                            if new == key:
+                                result.value = new
+                                result.unpark_all()
+                    if edge_eq:
+                        for key, result in edge_eq.items():
+                            if new == key:
+                                result.value = (new, old)
+                                result.unpark_all()
+                else:
+                    if level_result is not None:
+                        level_result.value = new
+                        level_result.unpark_all()
+                    if edge_result is not None:
+                        edge_result.value = (new, old)
+                        edge_result.unpark_all()
+            for f, result in level_results.items():
+                if f is _ANY_VALUE or f(new):
                     result.value = new
-                    result.event.unpark_all()
-            for f, result in self._edge_results.items():
-                if f(new, old):
-                    result.value = (new, old)
-                    result.event.unpark_all()
-            for f, output in self._transforms.items():
-                output.value = f(new)
-
-    @staticmethod
-    async def _wait_predicate(result_map, predicate):
-        with result_map.open_ref(predicate) as result:
-            await result.event.park()
-        return result.value
+                    result.unpark_all()
+            if edge_results:
+                for f, result in edge_results.items():
+                    if f is _ANY_TRANSITION or f(new, old):
+                        result.value = (new, old)
+                        result.unpark_all()
+            if not_value_results:
+                for state, result in not_value_results.items():
+                    if (result.task is not None or result.tasks) \
+                            and new != state.value:
+                        result.value = new
+                        result.unpark_all()
+            if transforms:
+                for f, output in transforms.items():
+                    output.value = f(new)
+
+    def _level_map_and_key(self, predicate):
+        """(result map, key) appropriate for this level predicate
+
+        Waits on hashable plain values go into _level_eq, which the
+        setter consults by direct lookup rather than a predicate scan.
+        """
+        if isinstance(predicate, _ValueWrapperBase):
+            try:
+                hash(predicate.value)
+            except TypeError:
+                pass
+            else:
+                level_eq = self._level_eq
+                if level_eq is None:
+                    level_eq = self._level_eq = _RefCountedDefaultDict(_Result)
+                return level_eq, predicate.value
+        return self._level_results, predicate
+
+    def _level_ref(self, predicate):
+        """open_ref() on the level map appropriate for this predicate"""
+        result_map, key = self._level_map_and_key(predicate)
+        return result_map.open_ref(key)
+
+    def _edge_map_and_key(self, predicate):
+        """(result map, key) appropriate for this edge predicate"""
+        if isinstance(predicate, _ValueWrapperBase):
+            try:
+                hash(predicate.value)
+            except TypeError:
+                pass
+            else:
+                edge_eq = self._edge_eq
+                if edge_eq is None:
+                    edge_eq = self._edge_eq = _RefCountedDefaultDict(_Result)
+                return edge_eq, predicate.value
+        edge_results = self._edge_results
+        if edge_results is None:
+            edge_results = self._edge_results = _RefCountedDefaultDict(_Result)
+        return edge_results, predicate
+
+    def _edge_ref(self, predicate):
+        """open_ref() on the edge map appropriate for this predicate"""
+        result_map, key = self._edge_map_and_key(predicate)
+        return result_map.open_ref(key)
 
     @overload
     async def wait_value(self, value: T, *, held_for=0.) -> T: ...
@@ -211,18 +421,38 @@ class AsyncValue(Generic[T]):
         returns value which satisfied the predicate
         (when held_for > 0, it's the most recent value)
         """
-        predicate = _ValueWrapper(value_or_predicate)
-        while True:
-            if not predicate(self._value):
-                value = await self._wait_predicate(self._level_results, predicate)
-            else:
+        predicate = _as_predicate(value_or_predicate)
+        if held_for <= 0:
+            if predicate(self._value):
                 value = self._value
-                await trio.sleep(0)
-            if held_for > 0:
+                await lowlevel.checkpoint()
+            else:
+                # incref/decref rather than open_ref, to spare the context
+                # manager allocation on this hot path
+                result_map, key = self._level_map_and_key(predicate)
+                result = result_map.incref(key)
+                try:
+                    await result.park()
+                finally:
+                    result_map.decref(key)
+                value = result.value
+            return value
+        # held_for:  rather than recursing into wait_value() per hold
+        # check, keep one ref on the negated predicate for the whole call
+        with self._level_ref(predicate) as result, \
+                self._level_results.open_ref(_NotPredicate(predicate)) as not_result:
+            while True:
+                if predicate(self._value):
+                    value = self._value
+                    await lowlevel.checkpoint()
+                else:
+                    await result.park()
+                    value = result.value
                 with trio.move_on_after(held_for):
-                    await self.wait_value(lambda v: not predicate(v))
+                    if predicate(self._value):
+                        await not_result.park()
                     continue
-            break
+                break
         return value
 
     # NOTE: it's hard to make both type check and lint happy with generator overloads
@@ -249,24 +479,38 @@ class AsyncValue(Generic[T]):
 
         If held_for > 0, the predicate must match for that duration.
         """
-        predicate = _ValueWrapper(value_or_predicate)
-        last_value = self._value
-        with self._level_results.open_ref(predicate) as result, \
-                self._level_results.open_ref(lambda v: v != last_value) as not_last_value, \
-                self._level_results.open_ref(lambda v: not predicate(v)) as not_predicate:
+        predicate = _as_predicate(value_or_predicate)
+        not_last_value = _NotEqualValue(self._value)
+        if self._not_value_results is None:
+            self._not_value_results = _RefCountedDefaultDict(_Result)
+        not_value_results = self._not_value_results
+        with ExitStack() as stack:
+            result = stack.enter_context(self._level_ref(predicate))
+            # the negated predicate is only consulted by the held_for logic,
+            # so don't burden the setter with it otherwise
+            not_predicate = stack.enter_context(
+                self._level_results.open_ref(_NotPredicate(predicate))) \
+                if held_for > 0 else None
             while True:
                 if predicate(self._value):
                     last_value = self._value
                 else:
-                    await result.event.park()
+                    await result.park()
                     last_value = result.value
+                not_last_value.value = last_value
                 if held_for > 0:
                     with trio.move_on_after(held_for):
-                        await not_predicate.event.park()
+                        await not_predicate.park()  # type: ignore[union-attr]  # held_for > 0
                         continue
                 yield last_value
+                # register the not-value state only while actually parked,
+                # so the setter never sees it while the caller body runs
                 if self._value == last_value:
-                    await not_last_value.event.park()
+                    not_last_result = not_value_results.incref(not_last_value)
+                    try:
+                        await not_last_result.park()
+                    finally:
+                        not_value_results.decref(not_last_value)
 
     # TODO: implement wait_transition() using transitions()
     @overload
@@ -290,7 +534,13 @@ class AsyncValue(Generic[T]):
 
         returns (value, old_value) which satisfied the predicate
         """
-        return await self._wait_predicate(self._edge_results, _ValueWrapper(value_or_predicate))
+        result_map, key = self._edge_map_and_key(_as_edge_predicate(value_or_predicate))
+        result = result_map.incref(key)
+        try:
+            await result.park()
+        finally:
+            result_map.decref(key)
+        return result.value
 
     @overload
     async def transitions(self, value: T) -> AsyncIterator[Tuple[T, T]]: yield (self._value, self._value)
@@ -321,10 +571,10 @@ class AsyncValue(Generic[T]):
 
         # Note this is not simply `while True: await wait_transition(...)`,
         # in order to maintain a ref on the predicate throughout the loop.
-        predicate = _ValueWrapper(value_or_predicate)
-        with self._edge_results.open_ref(predicate) as result:
+        predicate = _as_edge_predicate(value_or_predicate)
+        with self._edge_ref(predicate) as result:
             while True:
-                await result.event.park()
+                await result.park()
                 yield result.value
 
     # TODO: make the output's `value` read-only somehow
@@ -345,7 +595,9 @@ class AsyncValue(Generic[T]):
 
     @contextmanager
     def _open_transform(self, function):
+        if self._transforms is None:
+            self._transforms = _RefCountedDefaultDict(partial(AsyncValue, _NONE))
         with self._transforms.open_ref(function) as output:
             if output.value is _NONE:
-                output.value = function(self.value)
+                output.value = function(self._value)
             yield output
@@ -1,12 +1,6 @@
 import trio
 
 
-async def _wait_and_call(f1, f2):
-    """await on f1() and call f2()"""
-    await f1()
-    f2()
-
-
 async def wait_any(*args):
     """Wait until any of the given async functions are completed.
 
@@ -21,8 +15,13 @@ async def wait_any(*args):
     """
     async with trio.open_nursery() as nursery:
         cancel = nursery.cancel_scope.cancel
+
+        async def _waiter(f):
+            await f()
+            cancel()
+
         for f in args:
-            nursery.start_soon(_wait_and_call, f, cancel)
+            nursery.start_soon(_waiter, f)
 
 
 async def wait_all(*args):
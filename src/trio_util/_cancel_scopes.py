@@ -4,8 +4,6 @@ from typing import Awaitable, Callable, AsyncIterator
 
 import trio
 
-from ._awaitables import _wait_and_call
-
 
 @asynccontextmanager
 async def move_on_when(fn: Callable[..., Awaitable],
@@ -25,9 +23,11 @@ async def move_on_when(fn: Callable[..., Awaitable],
 
     async with trio.open_nursery() as nursery:
         with trio.CancelScope() as cancel_scope:
-            nursery.start_soon(_wait_and_call,
-                               partial(fn, *args, **kwargs),
-                               cancel_scope.cancel)
+            async def _waiter():
+                await fn(*args, **kwargs)
+                cancel_scope.cancel()
+
+            nursery.start_soon(_waiter)
             yield cancel_scope
         nursery.cancel_scope.cancel()
 
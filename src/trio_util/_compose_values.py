@@ -1,6 +1,6 @@
 from collections import namedtuple
 from contextlib import contextmanager, ExitStack
-from functools import partial
+from functools import lru_cache
 from typing import Callable, Any, TypeVar, overload
 try:
     from typing import ContextManager
@@ -10,8 +10,11 @@ except ImportError:
 from ._async_value import AsyncValue
 
 
-def _IDENTITY(x):
-    return x
+@lru_cache(maxsize=64)
+def _composite_type(keys):
+    # namedtuple() exec's a class template, which is costly enough to
+    # cache for contexts reusing the same field names
+    return namedtuple('CompositeValue', keys)  # type: ignore[misc]
 
 
 T_OUT = TypeVar('T_OUT')
@@ -71,27 +74,46 @@ def compose_values(*, _transform_=None, **value_map):
 
 @contextmanager
 def _compose_values(_transform_, value_map):
-    transform = _transform_ or _IDENTITY
     async_vals = value_map.values()
-    if not (async_vals and all(isinstance(av, AsyncValue) for av in async_vals)):
+    if not async_vals:
         raise TypeError('expected instances of AsyncValue')
-    value_type = namedtuple('CompositeValue', value_map.keys())  # type: ignore[misc]
-    composite_value = value_type._make(av.value for av in async_vals)
-    composite = AsyncValue(transform(composite_value))
-
-    # This dummy wait_value() predicate hooks into each value and updates
-    # the composite as a side effect.
-    def _update_composite(name, val):
-        nonlocal composite_value
-        composite_value = composite_value._replace(**{name: val})
-        composite.value = transform(composite_value)
-        return False
+    # mutable field buffer-- the namedtuple is only materialized on publish,
+    # avoiding _replace() and its kwargs dispatch per update
+    # (validated and collected in the same pass)
+    buffer = []
+    for async_val in async_vals:
+        if not isinstance(async_val, AsyncValue):
+            raise TypeError('expected instances of AsyncValue')
+        buffer.append(async_val.value)
+    value_type = _composite_type(tuple(value_map))
+    composite = AsyncValue(_transform_(value_type._make(buffer)) if _transform_
+                           else value_type._make(buffer))
+
+    # These dummy wait_value() predicates hook into each value and update
+    # the composite as a side effect.  Each input gets a closure with its
+    # field index bound directly (rather than a partial() layer), and the
+    # default (no transform) case gets its own variant so it doesn't pay
+    # for an identity call per update.
+    if _transform_:
+        def _make_hook(index):
+            def _update_composite(val):
+                buffer[index] = val
+                composite.value = _transform_(value_type._make(buffer))
+                return False
+            return _update_composite
+    else:
+        def _make_hook(index):
+            def _update_composite(val):
+                buffer[index] = val
+                composite.value = value_type._make(buffer)
+                return False
+            return _update_composite
 
     with ExitStack() as stack:
-        for name_, async_val in value_map.items():
+        for index_, async_val in enumerate(async_vals):
             # NOTE: by using AsyncValue internals we avoid running wait_value()
             # as a child task for each input.
             stack.enter_context(
-                async_val._level_results.open_ref(partial(_update_composite, name_)))
+                async_val._level_results.open_ref(_make_hook(index_)))
 
         yield composite
@@ -1,41 +1,101 @@
-from collections import defaultdict
-from contextlib import _GeneratorContextManager
 from functools import wraps
 from inspect import iscoroutinefunction
-from typing import Type, Dict, List
+from typing import Type, Dict
 
 import trio
 
 
-class _AsyncFriendlyGeneratorContextManager(_GeneratorContextManager):
-    """
-    Hack contextlib._GeneratorContextManager so that resulting context
-    manager can properly decorate async functions.
+def _leaf_exceptions(multi_error):
+    """Yield the non-MultiError leaves of a (possibly nested) MultiError"""
+    for e in multi_error.exceptions:
+        if isinstance(e, trio.MultiError):
+            yield from _leaf_exceptions(e)
+        else:
+            yield e
+
+
+class _MultiErrorDeferCM:
+    """Class-based context manager backing multi_error_defer_to()
+
+    A plain __enter__/__exit__ pair is much cheaper to enter and exit than
+    a generator-based context manager on the (overwhelmingly common)
+    no-exception path.  Since the object is stateless it's also reentrant,
+    so decorated functions reuse it directly rather than recreating a
+    context manager per call.
     """
 
+    __slots__ = ['privileged_types', 'priority_by_type', 'use_mro',
+                 'propagate_multi_error', 'strict']
+
+    def __init__(self, privileged_types, propagate_multi_error, strict):
+        self.privileged_types = privileged_types
+        self.priority_by_type = {t: i for i, t in enumerate(privileged_types)}
+        # the MRO shortcut is authoritative only if no privileged type
+        # customizes isinstance() (e.g. ABC virtual subclass registration)
+        self.use_mro = all(type(t).__instancecheck__ is type.__instancecheck__
+                           for t in privileged_types)
+        self.propagate_multi_error = propagate_multi_error
+        self.strict = strict
+
     def __call__(self, func):
         if iscoroutinefunction(func):
             @wraps(func)
             async def inner(*args, **kwargs):
-                with self._recreate_cm():  # type: ignore[attr-defined]
+                with self:
                     return await func(*args, **kwargs)
         else:
             @wraps(func)
             def inner(*args, **kwargs):
-                with self._recreate_cm():  # type: ignore[attr-defined]
+                with self:
                     return func(*args, **kwargs)
         return inner
 
-
-def _async_friendly_contextmanager(func):
-    """
-    Equivalent to @contextmanager, except the resulting (non-async) context
-    manager works correctly as a decorator on async functions.
-    """
-    @wraps(func)
-    def helper(*args, **kwargs):
-        return _AsyncFriendlyGeneratorContextManager(func, args, kwargs)
-    return helper
+    def __enter__(self):
+        return None
+
+    def __exit__(self, exc_type, root_multi_error, _):
+        if exc_type is None or not issubclass(exc_type, trio.MultiError):
+            return False
+        privileged_types = self.privileged_types
+        priority_by_type = self.priority_by_type
+        # single pass over the leaves: validate each one, compute its
+        # priority, and track the best candidates inline
+        best_priority = len(privileged_types)
+        best_error: BaseException = root_multi_error
+        # exception_repr -> exception_object at the best priority (strict only)
+        best_errors_by_repr: Dict[str, BaseException] = {}
+        strict = self.strict
+        for e in _leaf_exceptions(root_multi_error):
+            if not isinstance(e, privileged_types):
+                # not in privileged list
+                if self.propagate_multi_error:
+                    return False
+                raise RuntimeError('Unhandled trio.MultiError') from root_multi_error
+            if self.use_mro:
+                # hashed lookup over the MRO rather than an isinstance() scan
+                # of privileged_types per exception (cannot miss, since the
+                # isinstance() check above passed)
+                priority = min(priority_by_type[t] for t in type(e).__mro__
+                               if t in priority_by_type)
+            else:
+                priority = next(i for i, t in enumerate(privileged_types)
+                                if isinstance(e, t))
+            if priority < best_priority:
+                best_priority = priority
+                best_error = e
+                if strict:
+                    best_errors_by_repr = {repr(e): e}
+            elif priority == best_priority and strict:
+                best_errors_by_repr[repr(e)] = e
+        # the error (or one of the errors) of the most privileged type wins
+        if strict:
+            if len(best_errors_by_repr) > 1:
+                # multiple unique exception objects at the same priority
+                if self.propagate_multi_error:
+                    return False
+                raise RuntimeError('Unhandled trio.MultiError') from root_multi_error
+            best_error = next(iter(best_errors_by_repr.values()))
+        raise best_error
 
 
 def defer_to_cancelled(*args: Type[Exception]):
@@ -71,7 +131,6 @@ def defer_to_cancelled(*args: Type[Exception]):
     return multi_error_defer_to(trio.Cancelled, *args)
 
 
-@_async_friendly_contextmanager
 def multi_error_defer_to(*privileged_types: Type[BaseException],
                          propagate_multi_error=True,
                          strict=True):
@@ -119,36 +178,4 @@ def multi_error_defer_to(*privileged_types: Type[BaseException],
         are instances of the privileged type).  When combined with
         propagate_multi_error=False, this case will raise a RuntimeError.
     """
-    try:
-        yield
-    except trio.MultiError as root_multi_error:
-        # flatten the exceptions in the MultiError, grouping by repr()
-        multi_errors = [root_multi_error]
-        errors_by_repr = {}  # exception_repr -> exception_object
-        while multi_errors:
-            multi_error = multi_errors.pop()
-            for e in multi_error.exceptions:
-                if isinstance(e, trio.MultiError):
-                    multi_errors.append(e)
-                    continue
-                if not isinstance(e, privileged_types):
-                    # not in privileged list
-                    if propagate_multi_error:
-                        raise
-                    raise RuntimeError('Unhandled trio.MultiError') from root_multi_error
-                errors_by_repr[repr(e)] = e
-        # group the resulting errors by index in the privileged type list
-        # priority_index -> exception_object
-        errors_by_priority: Dict[int, List[BaseException]] = defaultdict(list)
-        for e in errors_by_repr.values():
-            for priority, privileged_type in enumerate(privileged_types):
-                if isinstance(e, privileged_type):
-                    errors_by_priority[priority].append(e)
-        # the error (or one of the errors) of the most privileged type wins
-        priority_errors = errors_by_priority[min(errors_by_priority)]
-        if strict and len(priority_errors) > 1:
-            # multiple unique exception objects at the same priority
-            if propagate_multi_error:
-                raise
-            raise RuntimeError('Unhandled trio.MultiError') from root_multi_error
-        raise priority_errors[0]
+    return _MultiErrorDeferCM(privileged_types, propagate_multi_error, strict)
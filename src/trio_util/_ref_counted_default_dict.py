@@ -1,13 +1,19 @@
-from collections import defaultdict
 from contextlib import contextmanager
 
+_MISSING = object()
 
-class _RefCountedDefaultDict(defaultdict):
-    """defaultdict offering deterministic collection of unreferenced keys"""
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.refs_by_key = defaultdict(int)
+class _RefCountedDefaultDict(dict):
+    """dict offering deterministic collection of unreferenced keys
+
+    Values are created on demand by the given factory, as with
+    defaultdict, but only through incref() / open_ref().
+    """
+
+    def __init__(self, default_factory):
+        super().__init__()
+        self.default_factory = default_factory
+        self.refs_by_key = {}
 
     @contextmanager
     def open_ref(self, key):
@@ -16,11 +22,31 @@ class _RefCountedDefaultDict(defaultdict):
         At context exit, the given key will be deleted if there are no other
         open references.
         """
-        self.refs_by_key[key] += 1
         try:
-            yield self[key]
+            yield self.incref(key)
         finally:
-            self.refs_by_key[key] -= 1
-            if self.refs_by_key[key] == 0:
-                del self[key]
-                del self.refs_by_key[key]
+            self.decref(key)
+
+    def incref(self, key):
+        """Take a reference on key, returning the corresponding value
+
+        This is open_ref() without the context manager allocation; the
+        caller must guarantee a matching decref().
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = self[key] = self.default_factory()
+            self.refs_by_key[key] = 1
+        else:
+            self.refs_by_key[key] += 1
+        return value
+
+    def decref(self, key):
+        """Release a reference taken with incref(), deleting the key if it
+        was the last one"""
+        refs = self.refs_by_key[key] - 1
+        if refs:
+            self.refs_by_key[key] = refs
+        else:
+            del self[key]
+            del self.refs_by_key[key]
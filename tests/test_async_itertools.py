@@ -27,3 +27,23 @@ async def test_azip_longest(autojump_clock):
             periodic_iter(range(5)), periodic_iter(range(3)), fillvalue=-10):
         assert item == next(expected)
     assert trio.current_time() - t0 == 5
+
+
+async def test_azip_single(autojump_clock):
+    # single iterable takes the no-nursery fast path
+    expected = zip(range(3))
+    async for item in azip(periodic_iter(range(3))):
+        assert item == next(expected)
+    assert next(expected, None) is None
+
+
+async def test_azip_longest_single(autojump_clock):
+    expected = zip_longest(range(3))
+    async for item in azip_longest(periodic_iter(range(3))):
+        assert item == next(expected)
+    assert next(expected, None) is None
+
+
+async def test_azip_longest_empty():
+    async for _ in azip_longest():
+        assert False, 'expected no items'
@@ -146,6 +146,29 @@ async def test_wait_transition_by_value(nursery):
     await done.wait()
 
 
+async def test_wait_value_unhashable_new_value(nursery):
+    # a wait on a hashable value must still fire when the assigned value
+    # is unhashable but compares equal (frozenset({1}) == {1})
+    level_done = trio.Event()
+    edge_done = trio.Event()
+    x: AsyncValue = AsyncValue(None)
+
+    @nursery.start_soon
+    async def _level_listener():
+        assert await x.wait_value(frozenset({1})) == {1}
+        level_done.set()
+
+    @nursery.start_soon
+    async def _edge_listener():
+        assert await x.wait_transition(frozenset({1})) == ({1}, None)
+        edge_done.set()
+
+    await wait_all_tasks_blocked()
+    x.value = {1}
+    await level_done.wait()
+    await edge_done.wait()
+
+
 def _always_false(val):
     return False
 
@@ -153,9 +176,10 @@ def _always_false(val):
 @pytest.mark.parametrize('initial_val, wait_val, expected_queue_key_types', [
     # event already set to desired value, so no wait queue
     ('foo', 'foo', []),
-    # listeners waiting for the same value, so wait queue is shared
-    ('foo', 'bar', [_ValueWrapper]),
-    (False, True, [_ValueWrapper]),
+    # listeners waiting for the same hashable value share a wait queue,
+    # keyed by the value itself
+    ('foo', 'bar', [str]),
+    (False, True, [bool]),
     # unhashable value requires a wait queue per listener
     (None, {}, [_ValueWrapper, _ValueWrapper]),
     # (same) predicate will be keyed by the function object
@@ -172,7 +196,9 @@ async def test_wait_queue(initial_val, wait_val, expected_queue_key_types, nurse
     nursery.start_soon(listener, x)
     nursery.start_soon(listener, x)
     await wait_all_tasks_blocked()
-    assert [type(val) for val in x._level_results] == expected_queue_key_types
+    queue_key_types = [type(val) for val in x._level_results]
+    queue_key_types += [type(val) for val in x._level_eq or ()]
+    assert queue_key_types == expected_queue_key_types
 
 
 def _even(v):
@@ -320,10 +346,10 @@ async def test_transitions_parallel_consumers(autojump_clock):
             await trio.sleep(.1)
         for event in done_events:
             await event.wait()
-        assert len(x._edge_results) == unique_predicates
+        assert len(x._edge_results or ()) + len(x._edge_eq or ()) == unique_predicates
         nursery.cancel_scope.cancel()
 
-    assert not x._edge_results
+    assert not x._edge_results and not x._edge_eq
 
 
 def test_open_transform():
@@ -1,3 +1,5 @@
+from abc import ABCMeta
+
 import pytest
 import trio
 
@@ -137,3 +139,22 @@ async def test_multi_error_defer_decorating_async():
 
     with pytest.raises(trio.Cancelled):
         await foo()
+
+
+async def test_multi_error_defer_to_virtual_subclass():
+    class VirtualBase(Exception, metaclass=ABCMeta):
+        pass
+
+    class Mid(Exception):
+        pass
+
+    class Registered(Exception):
+        pass
+
+    VirtualBase.register(Registered)
+
+    # Registered is a virtual instance of the highest-priority type, which
+    # its MRO alone would not reveal
+    with pytest.raises(Registered):
+        with multi_error_defer_to(VirtualBase, Mid, Registered):
+            raise trio.MultiError([Mid(), Registered()])